@@ -1,62 +1,162 @@
 import argparse
+import html
+import io
+import json
+import os
 import re
 
-from typing import List, Optional
+from typing import Callable, List, Optional, Set, TextIO, Union
 from datetime import datetime
 from pathlib import Path
 
 from sql import Database, Paper
 
+# Markdown bold markers stripped from summaries in a single pass
+_MD_BOLD_RE = re.compile(r'\*\*|__')
+
+# Summary sections, e.g. "[Topics:] ...", each running up to the next section marker
+_SECTION_RE = re.compile(
+    r'\[(topics|tl;dr|summary):\]\s*(.*?)(?=\[(?:topics|tl;dr|summary):\]|\Z)',
+    re.I | re.S
+)
+_SECTION_KEYS = {'topics': 'topics', 'tl;dr': 'tldr', 'summary': 'summary'}
+_SECTION_HEADINGS = {'topics': 'Topics', 'tldr': 'TL;DR', 'summary': 'Summary'}
+
+# Comma separator between topics, absorbing the whitespace around it
+_TOPIC_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# Turns a topic into an Obsidian tag body: spaces become dashes, apostrophes are dropped
+_TOPIC_TAG_TRANS = str.maketrans({' ': '-', "'": None})
+
+# Escapes for JSON embedded in an inline <script>, so paper text cannot close the tag or open markup
+_SCRIPT_JSON_ESCAPES = str.maketrans({'<': '\\u003c', '>': '\\u003e', '&': '\\u0026'})
+
+# Write buffer for export files, so multi-MB outputs go out in few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def parse_summary(summary: str) -> dict:
+    """
+    Parse a generated summary into its topics, TL;DR, and summary sections.
+
+    Args:
+        summary: Summary text structured with [Topics:], [TL;DR:], and [Summary:] markers
+
+    Returns:
+        Dict with 'sections' (list of (key, raw body, topic list or None) tuples in summary order,
+        repeats included), and 'topics' (list of str), 'tldr' (str), and 'summary' (str) taken
+        from the last section of each kind; missing sections are empty
+    """
+    parsed = {"sections": [], "topics": [], "tldr": "", "summary": ""}
+    # Fast reject: every section marker starts with '[', so there is nothing to extract without one
+    if '[' not in summary:
+        return parsed
+    clean_summary = _MD_BOLD_RE.sub('', summary)
+    for match in _SECTION_RE.finditer(clean_summary):
+        key = _SECTION_KEYS[match.group(1).lower()]
+        body = match.group(2).strip()
+        topic_list = _TOPIC_SPLIT_RE.split(body) if key == 'topics' else None
+        parsed["sections"].append((key, body, topic_list))
+        parsed[key] = body if topic_list is None else topic_list
+    return parsed
+
+
+def _parsed_summary(paper: Paper) -> dict:
+    """Return the parsed summary of a paper, cached on the instance so multiple exporters parse it once."""
+    cached = getattr(paper, '_parsed_summary', None)
+    # Re-parse if the summary has been replaced since it was cached
+    if cached is None or cached[0] is not paper.summary:
+        cached = (paper.summary, parse_summary(paper.summary or ""))
+        paper._parsed_summary = cached
+    return cached[1]
+
+
+def _write_atomically(output_file: Path, write: Callable[[TextIO], None]) -> None:
+    """
+    Stream content into a temporary file next to output_file, then move it into place.
+
+    An exception while writing leaves any existing output_file untouched.
+    """
+    tmp_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            write(f)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _write_to_dir(output_file: Path, ensured_dirs: Set[Path], write: Callable[[TextIO], None]) -> None:
+    """
+    Write output_file atomically, creating its directory only if not already in ensured_dirs.
+
+    If a cached directory has since been removed, it is recreated and the write retried once.
+    """
+    parent = output_file.parent
+    if parent not in ensured_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        ensured_dirs.add(parent)
+    try:
+        _write_atomically(output_file, write)
+    except FileNotFoundError:
+        if parent.is_dir():
+            raise
+        parent.mkdir(parents=True, exist_ok=True)
+        _write_atomically(output_file, write)
+
+
+def _sort_by_title(papers: List[Paper]) -> List[Paper]:
+    """Sort papers case-insensitively by title, keeping input order for ties."""
+    # Decorate-sort-undecorate so comparisons stay on (str, int) tuples in C
+    keyed = [(paper.title.lower(), i, paper) for i, paper in enumerate(papers)]
+    keyed.sort()
+    return [item[2] for item in keyed]
+
 
 class MarkdownExporter:
     def __init__(self, db: Database):
         self.db = db
+        # Output directories already created by this exporter
+        self._ensured_dirs: Set[Path] = set()
 
     def generate_markdown(self, papers: List[Paper], title: str = "Research Paper Summaries") -> str:
         """Generate markdown content from a list of papers."""
+        if not papers:
+            raise ValueError("No papers to export")
+
+        buffer = io.StringIO()
+        self._write_markdown(papers, title, buffer)
+        return buffer.getvalue()
+
+    def _write_markdown(self, papers: List[Paper], title: str, fp: TextIO) -> None:
+        """Write markdown content for a list of papers to a text stream, one paper at a time."""
         # Sort papers by title
-        papers = sorted(papers, key=lambda x: x.title.lower())
+        papers = _sort_by_title(papers)
         
-        md_content = f"# {title}\n\n"
-        md_content += f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} by [PubSummarizer](https://github.com/Logan-Lin/PubSummarizer)*\n\n"
+        fp.write(f"# {title}\n\n")
+        fp.write(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} by [PubSummarizer](https://github.com/Logan-Lin/PubSummarizer)*\n\n")
 
         for paper in papers:
-            md_content += self._format_paper(paper)
-
-        return md_content
+            fp.writelines(self._format_paper_parts(paper))
 
-    def _format_paper(self, paper: Paper) -> str:
-        """Format a single paper into markdown."""
-        md_text = f"## {paper.title}\n\n"
+    def _format_paper_parts(self, paper: Paper) -> List[str]:
+        """Format a single paper into a list of markdown fragments."""
+        parts = [f"## {paper.title}\n\n"]
         
-        if paper.summary:
-            # Split summary into topics and main summary
-            clean_summary = paper.summary.replace('**', '').replace('__', '')
-            
-            # Extract topics, TL;DR, and summary sections
-            sections = clean_summary.split('[')
-            for section in sections:
-                section_lower = section.lower()
-                if section_lower.startswith('topics:]'):
-                    topics = re.sub(r'(?i)Topics:]', '', section).strip()
-                    md_text += "### Topics\n\n"
-                    md_text += f"{topics}\n\n"
-                elif section_lower.startswith('tl;dr:]'):
-                    tldr = re.sub(r'(?i)TL;DR:]', '', section).strip()
-                    md_text += "### TL;DR\n\n"
-                    md_text += f"{tldr}\n\n"
-                elif section_lower.startswith('summary:]'):
-                    summary = re.sub(r'(?i)Summary:]', '', section).strip()
-                    md_text += "### Summary\n\n"
-                    md_text += f"{summary}\n\n"
+        # Topics, TL;DR, and summary sections, in summary order
+        for key, body, _ in _parsed_summary(paper)["sections"]:
+            parts.append(f"### {_SECTION_HEADINGS[key]}\n\n")
+            parts.append(f"{body}\n\n")
 
         if paper.pdf_url:
-            md_text += f"**Paper URL**: [{paper.pdf_url}]({paper.pdf_url})\n\n"
+            parts.append(f"**Paper URL**: [{paper.pdf_url}]({paper.pdf_url})\n\n")
         
-        md_text += "---\n\n"
-        return md_text
+        parts.append("---\n\n")
+        return parts
 
-    def export_to_file(self, output_path: str, filters: Optional[dict] = None, title: str = "Research Paper Summaries") -> None:
+    def export_to_file(self, output_path: str, filters: Optional[dict] = None, title: str = "Research Paper Summaries",
+                       papers: Optional[List[Paper]] = None) -> None:
         """
         Export papers from database to a markdown file.
         
@@ -64,83 +164,69 @@ class MarkdownExporter:
             output_path: Path where the markdown file will be saved
             filters: Optional filters to apply when querying papers
             title: Custom title for the markdown document
+            papers: Already-fetched papers to export; if given, the database is not queried
         """
-        papers = self.db.get_papers(filters)
+        if papers is None:
+            papers = self.db.get_papers(filters)
         
         if not papers:
             raise ValueError("No papers found in the database with the given filters")
 
-        # Generate markdown content with custom title
-        md_content = self.generate_markdown(papers, title)
-
-        # Ensure the output directory exists
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        # Ensure the output directory exists (once per directory), then stream markdown content
+        # with custom title to the file, replacing it only on success
+        _write_to_dir(Path(output_path), self._ensured_dirs, lambda f: self._write_markdown(papers, title, f))
 
 
 class ObsidianExporter:
     def __init__(self, db: Database):
         self.db = db
+        # Output directories already created by this exporter
+        self._ensured_dirs: Set[Path] = set()
 
     def generate_markdown(self, papers: List[Paper], title: str = "Research Paper Summaries") -> str:
         """Generate Obsidian-style markdown content from a list of papers."""
+        if not papers:
+            raise ValueError("No papers to export")
+
+        buffer = io.StringIO()
+        self._write_markdown(papers, title, buffer)
+        return buffer.getvalue()
+
+    def _write_markdown(self, papers: List[Paper], title: str, fp: TextIO) -> None:
+        """Write Obsidian-style markdown for a list of papers to a text stream, one paper at a time."""
         # Sort papers by title
-        papers = sorted(papers, key=lambda x: x.title.lower())
+        papers = _sort_by_title(papers)
 
-        md_content = "---\n"
-        md_content += f"title: {title}\n"
-        md_content += "---\n\n"
+        fp.write("---\n")
+        fp.write(f"title: {title}\n")
+        fp.write("---\n\n")
 
-        md_content += f"*Generated by [PubSummarizer](https://github.com/Insights-Ac/PubSummarizer)*\n\n"
+        fp.write("*Generated by [PubSummarizer](https://github.com/Insights-Ac/PubSummarizer)*\n\n")
 
         for paper in papers:
-            md_content += self._format_paper(paper)
-
-        return md_content
+            fp.writelines(self._format_paper_parts(paper))
 
-    def _format_paper(self, paper: Paper) -> str:
-        """Format a single paper into Obsidian-style markdown."""
+    def _format_paper_parts(self, paper: Paper) -> List[str]:
+        """Format a single paper into a list of Obsidian-style markdown fragments."""
         # Main content
-        md_text = "---\n\n"
-
-        md_text += f"### {paper.title}\n\n"
+        parts = ["---\n\n", f"### {paper.title}\n\n"]
         
-        if paper.summary:
-            # Split summary into topics and main summary
-            clean_summary = paper.summary.replace('**', '').replace('__', '')
-
-            # Process each section
-            sections = clean_summary.split('[')
-            for section in sections:
-                section_lower = section.lower()
-                if section_lower.startswith('topics:]'):
-                    topics = re.sub(r'(?i)Topics:]', '', section).strip()
-                    topic_list = [t.strip() for t in topics.split(',')]
-                    md_text += "**Topics:** "
-                    topic_tags = []
-                    for topic in topic_list:
-                        topic_clean = topic.replace(' ', '-').replace('\'', '')
-                        topic_tags.append(f"#{topic_clean.lower()}")
-                    md_text += ", ".join(topic_tags) + "\n\n"
-                elif section_lower.startswith('tl;dr:]'):
-                    tldr = re.sub(r'(?i)TL;DR:]', '', section).strip()
-                    md_text += "#### TL;DR\n\n"
-                    md_text += f"{tldr}\n\n"
-                elif section_lower.startswith('summary:]'):
-                    summary = re.sub(r'(?i)Summary:]', '', section).strip()
-                    md_text += "#### Summary\n\n"
-                    md_text += f"{summary}\n\n"
+        # Process each section, in summary order
+        for key, body, topic_list in _parsed_summary(paper)["sections"]:
+            if key == 'topics':
+                topic_tags = [f"#{topic.translate(_TOPIC_TAG_TRANS).lower()}" for topic in topic_list]
+                parts.append("**Topics:** " + ", ".join(topic_tags) + "\n\n")
+            else:
+                parts.append(f"#### {_SECTION_HEADINGS[key]}\n\n")
+                parts.append(f"{body}\n\n")
 
         if paper.pdf_url:
-            md_text += f"📄 [Paper Link]({paper.pdf_url})\n\n"
+            parts.append(f"📄 [Paper Link]({paper.pdf_url})\n\n")
         
-        return md_text
+        return parts
 
-    def export_to_file(self, output_path: str, filters: Optional[dict] = None, title: str = "Research Paper Summaries") -> None:
+    def export_to_file(self, output_path: str, filters: Optional[dict] = None, title: str = "Research Paper Summaries",
+                       papers: Optional[List[Paper]] = None) -> None:
         """
         Export papers from database to an Obsidian-style markdown file.
         
@@ -148,89 +234,51 @@ class ObsidianExporter:
             output_path: Path where the markdown file will be saved
             filters: Optional filters to apply when querying papers
             title: Custom title for the markdown document
+            papers: Already-fetched papers to export; if given, the database is not queried
         """
-        papers = self.db.get_papers(filters)
+        if papers is None:
+            papers = self.db.get_papers(filters)
         
         if not papers:
             raise ValueError("No papers found in the database with the given filters")
 
-        md_content = self.generate_markdown(papers, title)
-
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        _write_to_dir(Path(output_path), self._ensured_dirs, lambda f: self._write_markdown(papers, title, f))
 
 
-class WebExporter:
-    def __init__(self, db: Database):
-        self.db = db
-        
-    def generate_html(self, papers: List[Paper], title: str = "Research Paper Summaries") -> str:
-        """Generate HTML content from a list of papers."""
-        # Sort papers by title
-        papers = sorted(papers, key=lambda x: x.title.lower())
-        
-        # Convert papers to JSON-friendly format
-        papers_data = []
-        for paper in papers:
-            paper_dict = {
-                "title": paper.title,
-                "pdf_url": paper.pdf_url,
-                "topics": [],
-                "tldr": "",
-                "summary": ""
-            }
-            
-            if paper.summary:
-                clean_summary = paper.summary.replace('**', '').replace('__', '')
-                sections = clean_summary.split('[')
-                
-                for section in sections:
-                    section_lower = section.lower()
-                    if section_lower.startswith('topics:]'):
-                        topics = re.sub(r'(?i)Topics:]', '', section).strip()
-                        paper_dict["topics"] = [t.strip() for t in topics.split(',')]
-                    elif section_lower.startswith('tl;dr:]'):
-                        paper_dict["tldr"] = re.sub(r'(?i)TL;DR:]', '', section).strip()
-                    elif section_lower.startswith('summary:]'):
-                        paper_dict["summary"] = re.sub(r'(?i)Summary:]', '', section).strip()
-            
-            papers_data.append(paper_dict)
-
-        html_content = """
+# Page template for WebExporter; __TITLE__ and __PAPERS_JSON__ mark the dynamic parts,
+# so CSS/JS braces need no escaping
+_HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1">
-    <title>PubSummarizer - {title}</title>
+    <title>PubSummarizer - __TITLE__</title>
     <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
     <script src="https://unpkg.com/masonry-layout@4/dist/masonry.pkgd.min.js"></script>
     <style>
-        .filter-controls {{
+        .filter-controls {
             margin-bottom: 20px;
             padding: 15px;
             background-color: #f8f9fa;
             border-radius: 8px;
-        }}
-        .pagination-controls {{
+        }
+        .pagination-controls {
             margin: 20px 0;
             padding: 15px;
             background-color: #f8f9fa;
             border-radius: 8px;
-        }}
-        @media (max-width: 991px) {{
-            .search-box {{
+        }
+        @media (max-width: 991px) {
+            .search-box {
                 margin-bottom: 15px;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
     <div class="container py-4">
-        <h1 class="mb-4">{title}</h1>
+        <h1 class="mb-4">__TITLE__</h1>
         <p class="text-muted"><em>Generated by <a href="https://github.com/Insights-Ac/PaperBriefing">PaperBriefing</a></em></p>
         
         <div class="filter-controls">
@@ -269,80 +317,92 @@ class WebExporter:
             </div>
         </div>
 
-        <div id="papers-container" class="row" data-masonry='{{"percentPosition": true }}'></div>
+        <div id="papers-container" class="row" data-masonry='{"percentPosition": true }'></div>
     </div>
 
+    <!-- Paper card skeleton, cloned per paper and filled via textContent -->
+    <template id="paper-card-tpl">
+        <div class="col-sm-12 col-lg-6 col-xl-4 mb-4">
+            <div class="card shadow-sm">
+                <div class="card-body">
+                    <h3 class="card-title h4"></h3>
+                    <div class="mb-3 paper-topics">
+                        <div class="d-flex gap-2 flex-wrap"></div>
+                    </div>
+                    <div class="mb-3 paper-tldr">
+                        <h3 class="h5">TL;DR</h3>
+                        <p class="card-text"></p>
+                    </div>
+                    <div class="mb-3 paper-summary">
+                        <h3 class="h5">Summary</h3>
+                        <p class="card-text"></p>
+                    </div>
+                    <p class="card-text paper-url"><a class="btn btn-outline-primary btn-sm">Download Paper</a></p>
+                </div>
+            </div>
+        </div>
+    </template>
+
     <script>
         // Store papers data and pagination state
-        const papersData = {papers_json};
+        const papersData = __PAPERS_JSON__;
         let currentPage = 1;
         
         // Function to filter papers based on search input
-        function filterPapers(searchText) {{
+        function filterPapers(searchText) {
             if (!searchText) return papersData;
             
             searchText = searchText.toLowerCase();
-            return papersData.filter(paper => {{
-                const titleMatch = paper.title.toLowerCase().includes(searchText);
-                const topicsMatch = paper.topics.some(topic => 
-                    topic.toLowerCase().includes(searchText)
-                );
-                const tldrMatch = paper.tldr.toLowerCase().includes(searchText);
-                const summaryMatch = paper.summary.toLowerCase().includes(searchText);
-                
-                return titleMatch || topicsMatch || tldrMatch || summaryMatch;
-            }});
-        }}
+            // Each paper carries a prebuilt lowercased blob of its searchable fields
+            return papersData.filter(paper => paper._search.includes(searchText));
+        }
         
-        // Function to create paper card HTML
-        function createPaperCard(paper) {{
-            const showTopics = document.getElementById('showTopics').checked;
-            const showTldr = document.getElementById('showTldr').checked;
-            const showSummary = document.getElementById('showSummary').checked;
-
-            const topicsHtml = (showTopics && paper.topics.length > 0)
-                ? `<div class="mb-3">
-                     <div class="d-flex gap-2 flex-wrap">
-                       ${{paper.topics.map(topic => `<span class="badge text-bg-info">${{topic}}</span>`).join('')}}
-                     </div>
-                   </div>`
-                : '';
-                
-            const tldrHtml = (showTldr && paper.tldr)
-                ? `<div class="mb-3">
-                     <h3 class="h5">TL;DR</h3>
-                     <p class="card-text">${{paper.tldr}}</p>
-                   </div>`
-                : '';
-                
-            const summaryHtml = (showSummary && paper.summary)
-                ? `<div class="mb-3">
-                     <h3 class="h5">Summary</h3>
-                     <p class="card-text">${{paper.summary}}</p>
-                   </div>`
-                : '';
-                
-            const urlHtml = paper.pdf_url
-                ? `<p class="card-text"><a href="${{paper.pdf_url}}" class="btn btn-outline-primary btn-sm">Download Paper</a></p>`
-                : '';
-                
-            return `
-                <div class="col-sm-12 col-lg-6 col-xl-4 mb-4">
-                    <div class="card shadow-sm">
-                        <div class="card-body">
-                            <h3 class="card-title h4">${{paper.title}}</h3>
-                            ${{topicsHtml}}
-                            ${{tldrHtml}}
-                            ${{summaryHtml}}
-                            ${{urlHtml}}
-                        </div>
-                    </div>
-                </div>
-            `;
-        }}
+        // Function to create a paper card element from the card template
+        const cardTemplate = document.getElementById('paper-card-tpl');
+        function createPaperCard(paper, sections) {
+            const card = cardTemplate.content.firstElementChild.cloneNode(true);
+            card.querySelector('.card-title').textContent = paper.title;
+
+            const topicsEl = card.querySelector('.paper-topics');
+            if (sections.topics && paper.topics.length > 0) {
+                const badges = topicsEl.firstElementChild;
+                paper.topics.forEach(topic => {
+                    const badge = document.createElement('span');
+                    badge.className = 'badge text-bg-info';
+                    badge.textContent = topic;
+                    badges.appendChild(badge);
+                });
+            } else {
+                topicsEl.remove();
+            }
+
+            const tldrEl = card.querySelector('.paper-tldr');
+            if (sections.tldr && paper.tldr) {
+                tldrEl.querySelector('.card-text').textContent = paper.tldr;
+            } else {
+                tldrEl.remove();
+            }
+
+            const summaryEl = card.querySelector('.paper-summary');
+            if (sections.summary && paper.summary) {
+                summaryEl.querySelector('.card-text').textContent = paper.summary;
+            } else {
+                summaryEl.remove();
+            }
+
+            const urlEl = card.querySelector('.paper-url');
+            // Only link http(s) URLs, so a stored javascript: URL cannot run on click
+            if (paper.pdf_url && /^https?:\/\//i.test(paper.pdf_url)) {
+                urlEl.firstElementChild.href = paper.pdf_url;
+            } else {
+                urlEl.remove();
+            }
+
+            return card;
+        }
 
         // Function to create pagination controls
-        function createPagination(totalItems) {{
+        function createPagination(totalItems) {
             const itemsPerPage = parseInt(document.getElementById('itemsPerPage').value);
             const totalPages = Math.ceil(totalItems / itemsPerPage);
             const pagination = document.getElementById('pagination');
@@ -351,8 +411,8 @@ class WebExporter:
             
             // Previous button
             paginationHtml += `
-                <li class="page-item ${{currentPage === 1 ? 'disabled' : ''}}">
-                    <a class="page-link" href="#" data-page="${{currentPage - 1}}">Previous</a>
+                <li class="page-item ${currentPage === 1 ? 'disabled' : ''}">
+                    <a class="page-link" href="#" data-page="${currentPage - 1}">Previous</a>
                 </li>
             `;
             
@@ -362,75 +422,75 @@ class WebExporter:
             let endPage = Math.min(totalPages, startPage + maxVisiblePages - 1);
             
             // Adjust startPage if we're near the end
-            if (endPage - startPage + 1 < maxVisiblePages) {{
+            if (endPage - startPage + 1 < maxVisiblePages) {
                 startPage = Math.max(1, endPage - maxVisiblePages + 1);
-            }}
+            }
             
             // First page and ellipsis
-            if (startPage > 1) {{
+            if (startPage > 1) {
                 paginationHtml += `
                     <li class="page-item">
                         <a class="page-link" href="#" data-page="1">1</a>
                     </li>
                 `;
-                if (startPage > 2) {{
+                if (startPage > 2) {
                     paginationHtml += `
                         <li class="page-item disabled">
                             <span class="page-link">...</span>
                         </li>
                     `;
-                }}
-            }}
+                }
+            }
             
             // Visible pages
-            for (let i = startPage; i <= endPage; i++) {{
+            for (let i = startPage; i <= endPage; i++) {
                 paginationHtml += `
-                    <li class="page-item ${{currentPage === i ? 'active' : ''}}">
-                        <a class="page-link" href="#" data-page="${{i}}">${{i}}</a>
+                    <li class="page-item ${currentPage === i ? 'active' : ''}">
+                        <a class="page-link" href="#" data-page="${i}">${i}</a>
                     </li>
                 `;
-            }}
+            }
             
             // Last page and ellipsis
-            if (endPage < totalPages) {{
-                if (endPage < totalPages - 1) {{
+            if (endPage < totalPages) {
+                if (endPage < totalPages - 1) {
                     paginationHtml += `
                         <li class="page-item disabled">
                             <span class="page-link">...</span>
                         </li>
                     `;
-                }}
+                }
                 paginationHtml += `
                     <li class="page-item">
-                        <a class="page-link" href="#" data-page="${{totalPages}}">${{totalPages}}</a>
+                        <a class="page-link" href="#" data-page="${totalPages}">${totalPages}</a>
                     </li>
                 `;
-            }}
+            }
             
             // Next button
             paginationHtml += `
-                <li class="page-item ${{currentPage === totalPages ? 'disabled' : ''}}">
-                    <a class="page-link" href="#" data-page="${{currentPage + 1}}">Next</a>
+                <li class="page-item ${currentPage === totalPages ? 'disabled' : ''}">
+                    <a class="page-link" href="#" data-page="${currentPage + 1}">Next</a>
                 </li>
             `;
             
             pagination.innerHTML = paginationHtml;
             
             // Add click handlers
-            pagination.querySelectorAll('.page-link').forEach(link => {{
-                link.addEventListener('click', (e) => {{
+            pagination.querySelectorAll('.page-link').forEach(link => {
+                link.addEventListener('click', (e) => {
                     e.preventDefault();
                     const newPage = parseInt(e.target.dataset.page);
-                    if (!isNaN(newPage) && newPage >= 1 && newPage <= totalPages) {{
+                    if (!isNaN(newPage) && newPage >= 1 && newPage <= totalPages) {
                         currentPage = newPage;
                         renderPapers();
-                    }}
-                }});
-            }});
-        }}
+                    }
+                });
+            });
+        }
 
         // Render papers with pagination
-        function renderPapers() {{
+        function renderPapers() {
             const searchText = document.getElementById('searchInput').value;
             const filteredPapers = filterPapers(searchText);
             const itemsPerPage = parseInt(document.getElementById('itemsPerPage').value);
@@ -440,28 +500,35 @@ class WebExporter:
             const endIndex = startIndex + itemsPerPage;
             const paginatedPapers = filteredPapers.slice(startIndex, endIndex);
             
-            // Render papers
+            // Render papers into a fragment, then swap it in with a single DOM update
+            const sections = {
+                topics: document.getElementById('showTopics').checked,
+                tldr: document.getElementById('showTldr').checked,
+                summary: document.getElementById('showSummary').checked
+            };
+            const fragment = document.createDocumentFragment();
+            paginatedPapers.forEach(paper => fragment.appendChild(createPaperCard(paper, sections)));
             const container = document.getElementById('papers-container');
-            container.innerHTML = paginatedPapers.map(createPaperCard).join('');
+            container.replaceChildren(fragment);
             
             // Create pagination controls
             createPagination(filteredPapers.length);
             
             // Initialize Masonry layout
-            new Masonry(container, {{
+            new Masonry(container, {
                 percentPosition: true
-            }});
-        }}
+            });
+        }
 
         // Add event listeners
-        document.getElementById('searchInput').addEventListener('input', () => {{
+        document.getElementById('searchInput').addEventListener('input', () => {
             currentPage = 1;  // Reset to first page on search
             renderPapers();
-        }});
-        document.getElementById('itemsPerPage').addEventListener('change', () => {{
+        });
+        document.getElementById('itemsPerPage').addEventListener('change', () => {
             currentPage = 1;  // Reset to first page when changing items per page
             renderPapers();
-        }});
+        });
         document.getElementById('showTopics').addEventListener('change', renderPapers);
         document.getElementById('showTldr').addEventListener('change', renderPapers);
         document.getElementById('showSummary').addEventListener('change', renderPapers);
@@ -473,14 +540,60 @@ class WebExporter:
 </body>
 </html>
 """
-        import json
-        return html_content.format(
-            title=title,
-            date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            papers_json=json.dumps(papers_data)
-        )
-
-    def export_to_file(self, output_path: str, filters: Optional[dict] = None, title: str = "Research Paper Summaries") -> None:
+# Pre-split once so each export only joins the title in and streams the JSON payload in between
+_HTML_PROLOGUE, _HTML_EPILOGUE = _HTML_TEMPLATE.split('__PAPERS_JSON__')
+_HTML_PROLOGUE_PARTS = _HTML_PROLOGUE.split('__TITLE__')
+
+
+class WebExporter:
+    def __init__(self, db: Database):
+        self.db = db
+        # Output directories already created by this exporter
+        self._ensured_dirs: Set[Path] = set()
+        
+    def generate_html(self, papers: List[Paper], title: str = "Research Paper Summaries") -> str:
+        """Generate HTML content from a list of papers."""
+        if not papers:
+            raise ValueError("No papers to export")
+
+        buffer = io.StringIO()
+        self._write_html(papers, title, buffer)
+        return buffer.getvalue()
+
+    def _write_html(self, papers: List[Paper], title: str, fp: TextIO) -> None:
+        """Write the HTML page for a list of papers to a text stream, one paper at a time."""
+        # Sort papers by title
+        papers = _sort_by_title(papers)
+
+        fp.write(html.escape(title).join(_HTML_PROLOGUE_PARTS))
+
+        # Encode each paper separately so the full JSON array is never held in memory
+        fp.write('[')
+        for i, paper in enumerate(papers):
+            if i:
+                fp.write(',')
+            paper_json = json.dumps(self._paper_data(paper), ensure_ascii=True, separators=(',', ':'))
+            fp.write(paper_json.translate(_SCRIPT_JSON_ESCAPES))
+        fp.write(']')
+
+        fp.write(_HTML_EPILOGUE)
+
+    def _paper_data(self, paper: Paper) -> dict:
+        """Convert a single paper to a JSON-friendly dict."""
+        parsed = _parsed_summary(paper)
+        # Lowercased title, topics, TL;DR, and summary, so the page search is one substring test
+        search_text = "\n".join([paper.title, "\n".join(parsed["topics"]), parsed["tldr"], parsed["summary"]]).lower()
+        return {
+            "title": paper.title,
+            "pdf_url": paper.pdf_url,
+            "topics": parsed["topics"],
+            "tldr": parsed["tldr"],
+            "summary": parsed["summary"],
+            "_search": search_text
+        }
+
+    def export_to_file(self, output_path: str, filters: Optional[dict] = None, title: str = "Research Paper Summaries",
+                       papers: Optional[List[Paper]] = None) -> None:
         """
         Export papers from database to an HTML file.
         
@@ -488,56 +601,90 @@ class WebExporter:
             output_path: Path where the HTML file will be saved
             filters: Optional filters to apply when querying papers
             title: Custom title for the HTML page
+            papers: Already-fetched papers to export; if given, the database is not queried
         """
-        papers = self.db.get_papers(filters)
+        if papers is None:
+            papers = self.db.get_papers(filters)
         
         if not papers:
             raise ValueError("No papers found in the database with the given filters")
 
-        html_content = self.generate_html(papers, title)
+        _write_to_dir(Path(output_path), self._ensured_dirs, lambda f: self._write_html(papers, title, f))
+
+
+_EXPORTERS = {
+    'markdown': MarkdownExporter,
+    'obsidian': ObsidianExporter,
+    'html': WebExporter,
+}
+
 
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+def _export_format(value: str) -> str:
+    """argparse type for --format that rejects unknown format names."""
+    fmt = value.lower()
+    if fmt not in _EXPORTERS:
+        raise argparse.ArgumentTypeError(f"unsupported format: {value} (choose from 'markdown', 'obsidian', 'html')")
+    return fmt
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
 
+def _filters_json(value: str) -> dict:
+    """argparse type for --filters that only accepts a JSON object."""
+    try:
+        filters = json.loads(value)
+    except ValueError:
+        filters = None
+    if not isinstance(filters, dict):
+        raise argparse.ArgumentTypeError("--filters must be a JSON object")
+    return filters
 
-def export_papers(db_url: str, output_path: str, format: str = 'markdown', filters: Optional[dict] = None, title: str = "Research Paper Summaries") -> None:
+
+def export_papers(db_url: str, output_path: Union[str, List[str]], format: Union[str, List[str]] = 'markdown',
+                  filters: Optional[dict] = None, title: str = "Research Paper Summaries") -> None:
     """
-    Convenience function to export papers from a database to either markdown, Obsidian, or HTML format.
+    Convenience function to export papers from a database to markdown, Obsidian, and/or HTML format.
+    
+    Several formats can be exported in one run by passing lists of formats and output paths
+    (e.g. format=['markdown', 'html'], output_path=['papers.md', 'papers.html']); the papers
+    are queried from the database only once and shared by all exporters.
     
     Args:
         db_url: Database URL to connect to
-        output_path: Path where the output file will be saved
-        format: Output format - either 'markdown', 'obsidian', or 'html' (default: 'markdown')
+        output_path: Path where the output file will be saved, or a list of paths, one per format
+        format: Output format - 'markdown', 'obsidian', or 'html', or a list of them (default: 'markdown')
         filters: Optional filters to apply when querying papers
         title: Custom title for the output document
     """
+    formats = [format] if isinstance(format, str) else list(format)
+    output_paths = [output_path] if isinstance(output_path, str) else list(output_path)
+
+    for fmt in formats:
+        if fmt.lower() not in _EXPORTERS:
+            raise ValueError(f"Unsupported format: {fmt}. Use 'markdown', 'obsidian', or 'html'")
+    if len(formats) != len(output_paths):
+        raise ValueError(f"Got {len(formats)} format(s) but {len(output_paths)} output path(s)")
+
     db = Database(db_url)
+    papers = db.get_papers(filters)
     
-    if format.lower() == 'markdown':
-        exporter = MarkdownExporter(db)
-    elif format.lower() == 'obsidian':
-        exporter = ObsidianExporter(db)
-    elif format.lower() == 'html':
-        exporter = WebExporter(db)
-    else:
-        raise ValueError(f"Unsupported format: {format}. Use 'markdown', 'obsidian', or 'html'")
-        
-    exporter.export_to_file(output_path, filters, title)
-    print(f"Exported papers to {output_path}")
+    for fmt, path in zip(formats, output_paths):
+        exporter = _EXPORTERS[fmt.lower()](db)
+        exporter.export_to_file(path, filters, title, papers=papers)
+        print(f"Exported papers to {path}")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Export papers from a database")
     parser.add_argument("--db_url", type=str, required=True, help="Database URL")
-    parser.add_argument("--output_path", type=str, required=True, help="Output path for the file")
-    parser.add_argument("--format", type=str, choices=['markdown', 'obsidian', 'html'], default='markdown', 
-                      help="Output format (markdown, obsidian, or html)")
-    parser.add_argument("--filters", type=dict, help="Filters to apply when querying papers", default={})
+    parser.add_argument("--output_path", type=str, nargs='+', required=True,
+                      help="Output path for the file (one per format when exporting several formats)")
+    parser.add_argument("--format", type=_export_format, nargs='+', default=['markdown'], 
+                      help="Output format (markdown, obsidian, or html); several can be given")
+    parser.add_argument("--filters", type=_filters_json, default={},
+                      help='Filters to apply when querying papers, as a JSON object (e.g. \'{"collection": "ICLR 2024"}\')')
     parser.add_argument("--title", type=str, default="Research Paper Summaries",
                       help="Custom title for the output document")
     args = parser.parse_args()
+    if len(args.format) != len(args.output_path):
+        parser.error("--output_path needs one path per --format")
 
     export_papers(args.db_url, args.output_path, args.format, args.filters, args.title)